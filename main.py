@@ -1,18 +1,21 @@
 import typer
-import asyncio
 import sys, os
-from src.green_agent import start_green_agent
-from src.launcher import test_send_message, launch_evaluation
-from src.white_agent import start_white_agent
-# from src.launcher import launch_evaluation
 
-sys.path.append(os.path.join(os.path.dirname(__file__), "external/tac"))
 app = typer.Typer(help="Agentified TheAgentCompany - Standardized agent assessment framework", no_args_is_help=True)
 
 
+def _add_tac_to_path():
+    """Make external/tac importable; only the green agent side needs it."""
+    tac_path = os.path.join(os.path.dirname(__file__), "external/tac")
+    if tac_path not in sys.path:
+        sys.path.append(tac_path)
+
+
 @app.command()
 def green():
     """Start the green agent (assessment manager)."""
+    _add_tac_to_path()
+    from src.green_agent import start_green_agent
     start_green_agent()
 
 
@@ -25,8 +28,11 @@ def run(port: int = None):
     if port is None:
         port = int(os.getenv("AGENT_PORT") or os.getenv("PORT") or 0)
     if role == "white":
+        from src.white_agent import start_white_agent
         start_white_agent(port=port if port > 0 else None)
     else:
+        _add_tac_to_path()
+        from src.green_agent import start_green_agent
         start_green_agent(port=port if port > 0 else None)
 
 
@@ -36,18 +42,24 @@ def test(
     message: str = typer.Option("Hello! This is a test message.", help="Message to send")
 ):
     """Test sending a message to an agent."""
+    import asyncio
+    from src.launcher import test_send_message
     asyncio.run(test_send_message(url, message))
 
 
 @app.command()
 def white():
     """Start the white agent (target being tested)."""
+    from src.white_agent import start_white_agent
     start_white_agent()
 
 
 @app.command()
 def launch():
     """Launch the complete evaluation workflow."""
+    import asyncio
+    _add_tac_to_path()
+    from src.launcher import launch_evaluation
     asyncio.run(launch_evaluation())
 
 
@@ -1,63 +1,118 @@
 #!/usr/bin/env python3
 """Check api-server status and logs."""
 
+import json
+import shutil
 import subprocess
 import sys
 import time
 
-def check_api_server():
-    """Check if api-server container is running and show logs."""
-    print("Checking api-server container status...")
-    print("=" * 60)
+import httpx
+
+try:
+    import docker
+except ImportError:
+    docker = None
+
+DOCKER = shutil.which("docker")
+
+
+def inspect_api_server():
+    """
+    Return (state, container) for the api-server container.
+    
+    state is None if the container does not exist. container is only set when
+    the Docker SDK is installed and reachable; otherwise the CLI is used.
     
-    # Check if container exists
+    Raises:
+        RuntimeError: If the SDK cannot be used and the docker CLI is not in PATH
+    """
+    if docker is not None:
+        try:
+            container = docker.from_env().containers.get("api-server")
+            return container.attrs["State"], container
+        except docker.errors.NotFound:
+            return None, None
+        except docker.errors.DockerException:
+            pass  # SDK cannot reach the daemon, fall back to the CLI
+    
+    if DOCKER is None:
+        raise RuntimeError("docker CLI not found in PATH")
+    
+    # One inspect call gives us existence, state and health
     result = subprocess.run(
-        ["docker", "ps", "-a", "--filter", "name=api-server", "--format", "{{.Names}}\t{{.Status}}"],
+        [DOCKER, "inspect", "--format", "{{json .State}}", "api-server"],
         capture_output=True,
         text=True
     )
+    if result.returncode != 0 or not result.stdout.strip():
+        return None, None
+    return json.loads(result.stdout), None
+
+
+def show_logs(container=None):
+    """Print the last 50 lines of api-server logs."""
+    print("\nShowing last 50 lines of logs:")
+    print("=" * 60)
+    if container:
+        # Stream straight from the daemon socket, no CLI fork; follow=False so a
+        # running container's logs end after the tail instead of being followed
+        for chunk in container.logs(tail=50, stream=True, follow=False):
+            sys.stdout.buffer.write(chunk)
+        sys.stdout.flush()
+    elif DOCKER is None:
+        print("❌ docker CLI not found in PATH, cannot show logs")
+    else:
+        subprocess.run([DOCKER, "logs", "--tail", "50", "api-server"])
+
+
+def check_api_server():
+    """Check if api-server container is running and show logs."""
+    print("Checking api-server container status...")
+    print("=" * 60)
+    
+    if docker is None and DOCKER is None:
+        print("❌ docker CLI not found in PATH")
+        return 1
     
-    if not result.stdout.strip():
+    try:
+        state, container = inspect_api_server()
+    except RuntimeError as e:
+        print(f"❌ {e} (and the Docker SDK cannot reach the daemon)")
+        return 1
+    if state is None:
         print("❌ api-server container not found")
         print("\nThe container may have failed to start. Check Docker logs.")
         return 1
     
-    print(f"Container status:\n{result.stdout}")
+    health = (state.get("Health") or {}).get("Status")
+    print(f"Container status:\n{state.get('Status')}" + (f" ({health})" if health else ""))
     
     # Check if it's running
-    if "Up" not in result.stdout:
+    if not state.get("Running"):
         print("\n⚠️  Container is not running!")
-        print("\nShowing last 50 lines of logs:")
-        print("=" * 60)
-        subprocess.run(["docker", "logs", "--tail", "50", "api-server"])
+        show_logs(container)
         return 1
     
-    # Check if port 2999 is accessible
+    # A single HTTP request both proves the port is open and that Flask responds
     print("\nChecking if port 2999 is accessible...")
-    import socket
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    sock.settimeout(2)
-    result = sock.connect_ex(('localhost', 2999))
-    sock.close()
-    
-    if result == 0:
-        print("✓ Port 2999 is accessible")
-        
-        # Try HTTP request
-        import urllib.request
-        try:
-            response = urllib.request.urlopen('http://localhost:2999', timeout=5)
-            print(f"✓ HTTP response: {response.status}")
-            return 0
-        except Exception as e:
-            print(f"⚠️  HTTP request failed: {e}")
-            return 1
-    else:
+    try:
+        response = httpx.get("http://localhost:2999", timeout=httpx.Timeout(5.0, connect=2.0))
+    except (httpx.ConnectError, httpx.ConnectTimeout):
         print("✗ Port 2999 is not accessible")
-        print("\nShowing last 50 lines of logs:")
-        print("=" * 60)
-        subprocess.run(["docker", "logs", "--tail", "50", "api-server"])
+        show_logs(container)
+        return 1
+    except httpx.HTTPError as e:
+        print("✓ Port 2999 is accessible")
+        print(f"⚠️  HTTP request failed: {e}")
+        return 1
+    
+    print("✓ Port 2999 is accessible")
+    if response.is_error:
+        print(f"⚠️  HTTP request failed: HTTP {response.status_code}")
         return 1
+    print(f"✓ HTTP response: {response.status_code}")
+    return 0
 
 
 if __name__ == "__main__":
@@ -9,6 +9,24 @@ import os
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+async def check_docker():
+    """Check if the Docker daemon is reachable. Returns (ok, message)."""
+    try:
+        result = await asyncio.create_subprocess_exec(
+            "docker", "ps",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await asyncio.wait_for(result.communicate(), timeout=5.0)
+        if result.returncode == 0:
+            return True, "✓ Docker daemon - accessible"
+        return False, f"✗ Docker daemon - error (returncode: {result.returncode})"
+    except FileNotFoundError:
+        return False, "✗ Docker daemon - Docker not installed or not in PATH"
+    except Exception as e:
+        return False, f"✗ Docker daemon - error: {type(e).__name__}: {e}"
+
+
 async def check_services(hostname: str = "localhost"):
     """Check if TAC services are accessible."""
     services = {
@@ -21,48 +39,40 @@ async def check_services(hostname: str = "localhost"):
     print(f"Checking TAC services at hostname: {hostname}")
     print("=" * 60)
     
+    # Probe all services and Docker concurrently over one pooled client.
+    # HEAD is enough for a liveness check; any status < 500 means the service is up.
+    timeout = httpx.Timeout(5.0, connect=2.0)
+    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
+        *responses, docker_status = await asyncio.gather(
+            *(client.head(url) for url in services.values()),
+            check_docker(),
+            return_exceptions=True,
+        )
+    
     all_ok = True
-    for name, url in services.items():
-        try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url, follow_redirects=True)
-                if response.status_code < 500:
-                    print(f"✓ {name:15} ({url:40}) - accessible (HTTP {response.status_code})")
-                else:
-                    print(f"✗ {name:15} ({url:40}) - returned HTTP {response.status_code}")
-                    all_ok = False
-        except httpx.ConnectError:
+    for (name, url), response in zip(services.items(), responses):
+        if isinstance(response, httpx.ConnectError):
             print(f"✗ {name:15} ({url:40}) - connection refused (service not running?)")
             all_ok = False
-        except httpx.TimeoutException:
+        elif isinstance(response, httpx.TimeoutException):
             print(f"✗ {name:15} ({url:40}) - timeout (service slow or not responding)")
             all_ok = False
-        except Exception as e:
-            print(f"✗ {name:15} ({url:40}) - error: {type(e).__name__}: {e}")
+        elif isinstance(response, Exception):
+            print(f"✗ {name:15} ({url:40}) - error: {type(response).__name__}: {response}")
+            all_ok = False
+        elif response.status_code < 500:
+            print(f"✓ {name:15} ({url:40}) - accessible (HTTP {response.status_code})")
+        else:
+            print(f"✗ {name:15} ({url:40}) - returned HTTP {response.status_code}")
             all_ok = False
     
     print("=" * 60)
     
     # Check Docker
     print("\nChecking Docker:")
-    try:
-        result = await asyncio.create_subprocess_exec(
-            "docker", "ps",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await asyncio.wait_for(result.communicate(), timeout=5.0)
-        if result.returncode == 0:
-            print("✓ Docker daemon - accessible")
-        else:
-            print(f"✗ Docker daemon - error (returncode: {result.returncode})")
-            all_ok = False
-    except FileNotFoundError:
-        print("✗ Docker daemon - Docker not installed or not in PATH")
-        all_ok = False
-    except Exception as e:
-        print(f"✗ Docker daemon - error: {type(e).__name__}: {e}")
-        all_ok = False
+    docker_ok, docker_message = docker_status
+    print(docker_message)
+    all_ok = all_ok and docker_ok
     
     print("=" * 60)
     
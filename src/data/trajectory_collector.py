@@ -1,10 +1,10 @@
 """Trajectory collection for white agent actions."""
 
-import json
 import time
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
+from ..utils.fast_json import write_json
 
 class TrajectoryCollector:
     """Collects trajectory of white agent actions."""
@@ -19,6 +19,7 @@ class TrajectoryCollector:
         self.task_name = task_name
         self.actions: List[Dict[str, Any]] = []
         self.start_time = time.time()
+        self._start_monotonic = time.monotonic()
     
     def add_action(
         self,
@@ -88,27 +89,18 @@ class TrajectoryCollector:
         Returns:
             Path to saved file
         """
-        trajectory = {
-            "task_name": self.task_name,
-            "start_time": self.start_time,
-            "end_time": time.time(),
-            "duration": time.time() - self.start_time,
-            "actions": self.actions,
-            "action_count": len(self.actions),
-        }
-        
-        with open(output_path, 'w') as f:
-            json.dump(trajectory, f, indent=2)
-        
+        write_json(self.get_trajectory(), output_path)
         return output_path
     
     def get_trajectory(self) -> Dict[str, Any]:
         """Get current trajectory as dictionary."""
+        # Monotonic duration is immune to wall-clock adjustments mid-task
+        duration = time.monotonic() - self._start_monotonic
         return {
             "task_name": self.task_name,
             "start_time": self.start_time,
-            "end_time": time.time(),
-            "duration": time.time() - self.start_time,
+            "end_time": self.start_time + duration,
+            "duration": duration,
             "actions": self.actions,
             "action_count": len(self.actions),
         }
@@ -164,8 +156,6 @@ class A2ATrajectoryCollector(TrajectoryCollector):
         trajectory = self.get_trajectory()
         trajectory["messages"] = self.messages
         
-        with open(output_path, 'w') as f:
-            json.dump(trajectory, f, indent=2)
-        
+        write_json(trajectory, output_path)
         return output_path
 
@@ -1,6 +1,8 @@
 import os
 import json
 import tomllib
+import functools
+import importlib.resources
 import uvicorn
 import asyncio
 from a2a.server.apps import A2AStarletteApplication
@@ -15,14 +17,30 @@ from .evaluation.evaluator import TACEvaluator, parse_evaluation_request
 from .evaluation.task_selector import parse_task_config
 
 
+@functools.lru_cache(maxsize=1)
 def load_card():
-    folder = __file__.rsplit("/", 1)[0]
-    path = f"{folder}/green_agent.toml"
-    with open(path, "rb") as f:
+    # Resolve relative to the package so this also works from zips/wheels
+    card_file = importlib.resources.files(__package__).joinpath("green_agent.toml")
+    with card_file.open("rb") as f:
         return tomllib.load(f)
 
 
+@functools.lru_cache(maxsize=1)
+def _base_card():
+    # Validate the card once; the URL is filled in per server via model_copy
+    return AgentCard.model_validate({**load_card(), "url": ""})
+
+
 class GreenAgentExecutor(AgentExecutor):
+    def __init__(self):
+        # Snapshot environment config once instead of on every request
+        self.server_hostname = os.getenv("SERVER_HOSTNAME", "localhost")
+        self.env_llm_config = {
+            "api_key": os.getenv("LITELLM_API_KEY"),
+            "base_url": os.getenv("LITELLM_BASE_URL"),
+            "model": os.getenv("LITELLM_MODEL", "openai/gpt-4o"),
+        }
+    
     async def execute(self, context: RequestContext, event_queue: EventQueue):
         message = context.get_user_input()
         print("Green agent received:", message)
@@ -61,19 +79,17 @@ class GreenAgentExecutor(AgentExecutor):
                 )
             )
             
-            # Get server hostname and environment LLM config from environment
-            server_hostname = os.getenv("SERVER_HOSTNAME", "localhost")
-            env_llm_config = {
-                "api_key": os.getenv("LITELLM_API_KEY"),
-                "base_url": os.getenv("LITELLM_BASE_URL"),
-                "model": os.getenv("LITELLM_MODEL", "openai/gpt-4o"),
-            }
-            
             # Create evaluator
             evaluator = TACEvaluator(
                 white_agent_url=white_agent_url,
-                server_hostname=server_hostname,
-                env_llm_config=env_llm_config,
+                server_hostname=self.server_hostname,
+                env_llm_config=self.env_llm_config,
+                max_concurrent_tasks=int(eval_config.get("max_concurrent_tasks", 1)),
+                per_task_timeout=(
+                    float(eval_config["per_task_timeout"])
+                    if eval_config.get("per_task_timeout") is not None
+                    else None
+                ),
             )
             
             # Run evaluation
@@ -104,48 +120,53 @@ class GreenAgentExecutor(AgentExecutor):
                 new_agent_text_message(error_msg)
             )
     
+    _RESULTS_RULE = "=" * 60
+    _RESULTS_HEADER = "\n".join(["\n" + _RESULTS_RULE, "EVALUATION RESULTS", _RESULTS_RULE, ""])
+    _RESULTS_SUMMARY = (
+        "Total Tasks: {total_tasks}\n"
+        "Completed: {completed}\n"
+        "Failed: {failed}\n"
+        "\n"
+        "Overall Score: {total_score}/{total_possible}\n"
+        "Score Percentage: {percentage:.1f}%\n"
+        "\n"
+        "Task Details:\n"
+        + "-" * 60
+    )
+    
     def _format_results(self, summary: dict, tasks: list) -> str:
         """Format evaluation results as a readable string."""
-        lines = [
-            "\n" + "="*60,
-            "EVALUATION RESULTS",
-            "="*60,
-            "",
-            f"Total Tasks: {summary.get('total_tasks', 0)}",
-            f"Completed: {summary.get('completed', 0)}",
-            f"Failed: {summary.get('failed', 0)}",
-            "",
-            f"Overall Score: {summary.get('total_score', 0)}/{summary.get('total_possible', 0)}",
-            f"Score Percentage: {summary.get('overall_score', 0.0)*100:.1f}%",
-            "",
-            "Task Details:",
-            "-"*60,
-        ]
-        
-        for task in tasks:
-            task_name = task.get("task_name", "unknown")
-            status = task.get("status", "unknown")
-            elapsed = task.get("elapsed_time", 0)
-            
-            if status == "completed":
-                eval_result = task.get("evaluation", {})
-                final_score = eval_result.get("final_score", {})
-                score = final_score.get("result", 0)
-                total = final_score.get("total", 0)
-                lines.append(
-                    f"  ✓ {task_name}: {score}/{total} ({elapsed:.1f}s)"
-                )
-            elif status == "failed":
-                error = task.get("error", "Unknown error")
-                lines.append(
-                    f"  ✗ {task_name}: FAILED - {error} ({elapsed:.1f}s)"
-                )
-            else:
-                lines.append(f"  ? {task_name}: {status}")
-        
-        lines.append("="*60)
+        summary_text = self._RESULTS_SUMMARY.format(
+            total_tasks=summary.get('total_tasks', 0),
+            completed=summary.get('completed', 0),
+            failed=summary.get('failed', 0),
+            total_score=summary.get('total_score', 0),
+            total_possible=summary.get('total_possible', 0),
+            percentage=summary.get('overall_score', 0.0) * 100,
+        )
+        task_lines = "\n".join(map(self._format_task_line, tasks))
+        parts = [self._RESULTS_HEADER, summary_text]
+        if task_lines:
+            parts.append(task_lines)
+        parts.append(self._RESULTS_RULE)
+        return "\n".join(parts)
+    
+    @staticmethod
+    def _format_task_line(task: dict) -> str:
+        """Format a single task's result line."""
+        task_name = task.get("task_name", "unknown")
+        status = task.get("status", "unknown")
+        elapsed = task.get("elapsed_time", 0)
         
-        return "\n".join(lines)
+        if status == "completed":
+            final_score = task.get("evaluation", {}).get("final_score", {})
+            score = final_score.get("result", 0)
+            total = final_score.get("total", 0)
+            return f"  ✓ {task_name}: {score}/{total} ({elapsed:.1f}s)"
+        if status == "failed":
+            error = task.get("error", "Unknown error")
+            return f"  ✗ {task_name}: FAILED - {error} ({elapsed:.1f}s)"
+        return f"  ? {task_name}: {status}"
 
     async def cancel(self, context, event_queue):
         pass
@@ -158,21 +179,19 @@ def start_green_agent(host=None, port=None):
     # AGENT_PORT is set by agentbeats when it spawns the agent process
     port = port or int(os.getenv("AGENT_PORT") or os.getenv("PORT") or "9001")
     
-    card_dict = load_card()
-    
     # Determine the agent URL based on HTTPS_ENABLED and CLOUDRUN_HOST
     https_enabled = os.getenv("HTTPS_ENABLED", "false").lower() == "true"
     cloudrun_host = os.getenv("CLOUDRUN_HOST")
     
     if cloudrun_host:
         protocol = "https" if https_enabled else "http"
-        card_dict["url"] = f"{protocol}://{cloudrun_host}"
+        url = f"{protocol}://{cloudrun_host}"
     else:
         # Use local host and port
         protocol = "https" if https_enabled else "http"
-        card_dict["url"] = f"{protocol}://{host}:{port}"
+        url = f"{protocol}://{host}:{port}"
 
-    card = AgentCard(**card_dict)
+    card = _base_card().model_copy(update={"url": url})
 
     handler = DefaultRequestHandler(
         agent_executor=GreenAgentExecutor(),
@@ -181,4 +200,6 @@ def start_green_agent(host=None, port=None):
 
     app = A2AStarletteApplication(agent_card=card, http_handler=handler).build()
     print("Starting green agent at:", f"http://{host}:{port}")
-    uvicorn.run(app, host=host, port=port)
+    # uvicorn's "auto" loop/http pick uvloop/httptools when uvicorn[standard] provides them;
+    # access logs add per-request overhead
+    uvicorn.run(app, host=host, port=port, access_log=False)
@@ -1,41 +1,49 @@
 """Evaluation orchestrator for TAC tasks."""
 
 import os
-import json
-import re
 import asyncio
 import time
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 import tempfile
 import uuid
+import httpx
 
 from .task_selector import TaskSelector, parse_task_config
 from ...utils.docker_manager import DockerManager
 from ...data.trajectory_collector import A2ATrajectoryCollector
 from ...utils.a2a_client import send_message_to_agent, wait_agent_ready
+from ...utils import fast_json
 
 # Task instructions data (now in src/data directory)
 DATA_DIR = Path(__file__).parent.parent.parent / "data"
 TASK_INSTRUCTIONS_FILE = DATA_DIR / "task_instructions.json"
 
-# Load precomputed task instructions if available
-_precomputed_instructions = None
-def _load_precomputed_instructions():
+
+def _load_precomputed_instructions() -> Dict[str, str]:
     """Load precomputed task instructions from JSON file."""
-    global _precomputed_instructions
-    if _precomputed_instructions is None:
-        if TASK_INSTRUCTIONS_FILE.exists():
-            try:
-                with open(TASK_INSTRUCTIONS_FILE, 'r') as f:
-                    _precomputed_instructions = json.load(f)
-                print(f"✓ Loaded {len(_precomputed_instructions)} precomputed task instructions")
-            except Exception as e:
-                print(f"⚠️  Failed to load precomputed instructions: {e}")
-                _precomputed_instructions = {}
-        else:
-            _precomputed_instructions = {}
-    return _precomputed_instructions
+    if not TASK_INSTRUCTIONS_FILE.exists():
+        return {}
+    try:
+        instructions = fast_json.read_json(TASK_INSTRUCTIONS_FILE)
+        print(f"✓ Loaded {len(instructions)} precomputed task instructions")
+        return instructions
+    except Exception as e:
+        print(f"⚠️  Failed to load precomputed instructions: {e}")
+        return {}
+
+
+# Precomputed task instructions, loaded once at import
+PRECOMPUTED_INSTRUCTIONS: Dict[str, str] = _load_precomputed_instructions()
+
+def _npc_container_name(task_name: str) -> str:
+    """Unique NPC container name, so the same task can run twice in one process."""
+    return f"tac_npc_{task_name}_{os.getpid()}_{uuid.uuid4().hex[:8]}"
+
+
+def _eval_container_name(task_name: str) -> str:
+    """Unique evaluation container name."""
+    return f"tac_eval_{task_name}_{os.getpid()}_{uuid.uuid4().hex[:8]}"
 
 
 class TACEvaluator:
@@ -48,6 +56,8 @@ class TACEvaluator:
         env_llm_config: Optional[Dict[str, str]] = None,
         output_dir: Optional[str] = None,
         use_host_network: bool = True,
+        max_concurrent_tasks: int = 1,
+        per_task_timeout: Optional[float] = None,
     ):
         """
         Initialize TAC evaluator.
@@ -58,6 +68,13 @@ class TACEvaluator:
             env_llm_config: Environment LLM configuration for evaluators
             output_dir: Directory to save evaluation results
             use_host_network: Whether to use Docker host networking
+            max_concurrent_tasks: Maximum number of tasks evaluated at once. Tasks share
+                the TAC services and /tmp/workspace, so only raise this for tasks that
+                do not interfere with each other.
+            per_task_timeout: Seconds before a single task is cancelled and recorded as
+                failed, so one stuck task cannot hold a concurrency slot indefinitely.
+                None (the default) means no overall cap; each step keeps its own
+                timeout (agent 600s, eval 900s, ...)
         """
         self.white_agent_url = white_agent_url.rstrip('/')
         
@@ -69,7 +86,19 @@ class TACEvaluator:
         self.server_hostname = server_hostname
         self.env_llm_config = env_llm_config or {}
         self.output_dir = output_dir or tempfile.mkdtemp(prefix="tac_eval_")
-        self.docker_manager = DockerManager(use_host_network=use_host_network)
+        # Warm evaluation containers are opt-in: the pool lives for one batch and is keyed
+        # by this evaluator's output_dir mount, so it only pays off when a batch repeats images
+        reuse_containers = os.getenv("REUSE_EVAL_CONTAINERS", "false").lower() == "true"
+        self.docker_manager = DockerManager(
+            use_host_network=use_host_network,
+            reuse_containers=reuse_containers,
+        )
+        self.max_concurrent_tasks = max(1, max_concurrent_tasks)
+        self.per_task_timeout = per_task_timeout
+        # Image availability from the up-front pull in evaluate_tasks
+        self._image_available: Dict[str, bool] = {}
+        # Shared connection pool to the white agent while evaluate_tasks runs
+        self._http_client: Optional[httpx.AsyncClient] = None
         Path(self.output_dir).mkdir(parents=True, exist_ok=True)
     
     async def evaluate_task(
@@ -77,6 +106,8 @@ class TACEvaluator:
         task_name: str,
         task_image: str,
         context_id: Optional[str] = None,
+        npc_container_name: Optional[str] = None,
+        eval_container_name: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Evaluate a single task.
@@ -85,29 +116,35 @@ class TACEvaluator:
             task_name: Name of the task (e.g., "pm-schedule-meeting-1")
             task_image: Docker image name for the task
             context_id: A2A context ID for conversation continuity
+            npc_container_name: Name for the NPC container; generated if not given
+            eval_container_name: Name for the evaluation container; generated if not given
         
         Returns:
             Evaluation results dictionary
         """
-        print(f"\n{'='*60}")
-        print(f"Evaluating task: {task_name}")
-        print(f"{'='*60}")
+        print(f"\n{'='*60}\nEvaluating task: {task_name}\n{'='*60}")
         
         start_time = time.time()
+        # Per-step durations in seconds, reported once when the task finishes
+        timings = {}
         task_results = {
             "task_name": task_name,
             "task_image": task_image,
             "status": "pending",
             "start_time": start_time,
+            "timings": timings,
         }
+        # Set once NPC start is attempted; stopped in `finally` unless already stopped
+        npc_started = False
         
         try:
             # Step 1: Pull Docker image if needed
             step_start = time.time()
-            print(f"[TIMING] Step 1: Preparing Docker image: {task_image}")
             try:
-                image_available = await self.docker_manager.pull_image(task_image)
-                print(f"[TIMING] Step 1 completed in {time.time() - step_start:.2f}s")
+                image_available = self._image_available.get(task_image)
+                if image_available is None:
+                    image_available = await self.docker_manager.pull_image(task_image)
+                timings["image"] = time.time() - step_start
                 if not image_available:
                     # If Docker fails, use a mock task instruction
                     print("⚠️  Docker not available, using mock task instruction")
@@ -152,11 +189,9 @@ class TACEvaluator:
             
             # Step 2: Get task instruction (use cached if available, otherwise Docker)
             step_start = time.time()
-            print(f"[TIMING] Step 2: Getting task instruction...")
-            precomputed = _load_precomputed_instructions()
+            task_instruction = PRECOMPUTED_INSTRUCTIONS.get(task_name)
             
-            if task_name in precomputed:
-                task_instruction = precomputed[task_name]
+            if task_instruction is not None:
                 print(f"✓ Using cached instruction for {task_name} ({len(task_instruction)} chars)")
             else:
                 print(f"⚠️  No cached instruction for {task_name}, extracting from Docker...")
@@ -165,12 +200,12 @@ class TACEvaluator:
                 except Exception as e:
                     print(f"⚠️  Could not get task instruction from Docker: {e}")
                     task_instruction = f"Complete the task for {task_name}. This is a mock instruction."
-            print(f"[TIMING] Step 2 completed in {time.time() - step_start:.2f}s")
+            timings["instruction"] = time.time() - step_start
             
             # Step 3: Initialize NPC environment BEFORE running agent
             step_start = time.time()
-            print(f"[TIMING] Step 3: Initializing NPC environment...")
-            npc_container_name = f"tac_npc_{task_name}_{os.getpid()}"
+            npc_container_name = npc_container_name or _npc_container_name(task_name)
+            npc_started = True
             try:
                 # Start NPCs in background - they need to be running while agent works
                 npc_result = await self.docker_manager.start_npc_environment(
@@ -185,11 +220,10 @@ class TACEvaluator:
                     print(f"⚠️  NPC environment failed to start (task may not need NPCs)")
             except Exception as e:
                 print(f"⚠️  NPC environment error: {e} (continuing anyway)")
-            print(f"[TIMING] Step 3 completed in {time.time() - step_start:.2f}s")
+            timings["npc_setup"] = time.time() - step_start
             
             # Step 4: Send task to white agent and collect responses
             step_start = time.time()
-            print(f"[TIMING] Step 4: Sending task to white agent at {self.white_agent_url}...")
             
             # Initialize trajectory collector
             trajectory_collector = A2ATrajectoryCollector(task_name)
@@ -200,36 +234,37 @@ class TACEvaluator:
             
             # Send initial task instruction
             # 600s (10 min) timeout - admin tasks may take longer
-            print(f"[TIMING] Sending message to white agent (timeout: 600s)...")
             response = await send_message_to_agent(
                 self.white_agent_url,
                 task_instruction,
                 context_id=task_context_id,
-                timeout=600.0
+                timeout=600.0,
+                httpx_client=self._http_client,
             )
             
             # Extract agent response
             agent_response = self._extract_message_text(response)
             trajectory_collector.add_message("agent", agent_response)
-            print(f"[TIMING] Step 4 completed in {time.time() - step_start:.2f}s")
+            timings["agent"] = time.time() - step_start
             
             # Stop NPC container now that agent is done
+            npc_started = False
             try:
                 await self.docker_manager.stop_npc_environment(npc_container_name)
             except Exception:
                 pass  # Ignore cleanup errors
             
             # Step 5: Save trajectory
+            step_start = time.time()
             trajectory_path = os.path.join(
                 self.output_dir,
                 f"traj_{task_name}.json"
             )
-            trajectory_collector.save(trajectory_path)
-            print(f"✓ Trajectory saved to {trajectory_path}")
+            await asyncio.to_thread(trajectory_collector.save, trajectory_path)
+            timings["trajectory_save"] = time.time() - step_start
             
             # Step 6: Run evaluation in Docker container
             step_start = time.time()
-            print(f"[TIMING] Step 6: Running Docker evaluation...")
             
             output_path = os.path.join(
                 self.output_dir,
@@ -237,7 +272,7 @@ class TACEvaluator:
             )
             
             # Use a unique container name for evaluation
-            container_name = f"tac_eval_{task_name}_{os.getpid()}_{int(time.time())}"
+            container_name = eval_container_name or _eval_container_name(task_name)
             
             # Check if we should skip Docker evaluation (for speed)
             skip_docker_eval = os.getenv("SKIP_DOCKER_EVAL", "false").lower() == "true"
@@ -252,7 +287,6 @@ class TACEvaluator:
                 }
             else:
                 try:
-                    print(f"[TIMING] Calling docker_manager.run_evaluation()...")
                     evaluation_result = await self.docker_manager.run_evaluation(
                         task_image,
                         container_name,
@@ -270,17 +304,15 @@ class TACEvaluator:
                             "task_name": task_name,
                             "error": "Docker evaluation returned no results",
                         }
-                    print(f"[TIMING] Step 6 completed in {time.time() - step_start:.2f}s")
                 except Exception as eval_error:
-                    print(f"⚠️  Docker evaluation failed: {eval_error}")
-                    print(f"[TIMING] Step 6 failed after {time.time() - step_start:.2f}s")
-                    print("⚠️  Using mock evaluation results")
+                    print(f"⚠️  Docker evaluation failed: {eval_error}; using mock evaluation results")
                     evaluation_result = {
                         "checkpoints": [{"total": 1, "result": 0}],
                         "final_score": {"total": 1, "result": 0},
                         "task_name": task_name,
                         "error": f"Docker evaluation failed: {eval_error}",
                     }
+                timings["evaluation"] = time.time() - step_start
             
             elapsed_time = time.time() - start_time
             
@@ -291,8 +323,11 @@ class TACEvaluator:
                 "trajectory_path": trajectory_path,
             })
             
-            print(f"✓ Task {task_name} completed in {elapsed_time:.2f}s")
-            print(f"  Score: {evaluation_result.get('final_score', {}).get('result', 0)}/{evaluation_result.get('final_score', {}).get('total', 0)}")
+            final_score = evaluation_result.get('final_score', {})
+            print(
+                f"✓ Task {task_name} completed in {elapsed_time:.2f}s\n"
+                f"  Score: {final_score.get('result', 0)}/{final_score.get('total', 0)}"
+            )
             
         except Exception as e:
             elapsed_time = time.time() - start_time
@@ -304,6 +339,15 @@ class TACEvaluator:
             print(f"✗ Task {task_name} failed: {e}")
             import traceback
             traceback.print_exc()
+        finally:
+            # The agent step failed or was cancelled: don't leave NPCs talking to the services
+            if npc_started:
+                try:
+                    await self.docker_manager.stop_npc_environment(npc_container_name)
+                except Exception:
+                    pass  # Ignore cleanup errors
+            if timings:
+                print(f"[TIMING] {task_name} " + " ".join(f"{step}={dt:.2f}s" for step, dt in timings.items()))
         
         return task_results
     
@@ -319,17 +363,20 @@ class TACEvaluator:
         """
         try:
             # Handle SendMessageSuccessResponse
-            if hasattr(response, 'result'):
-                result = response.result
-                if hasattr(result, 'parts'):
-                    texts = []
-                    for part in result.parts:
-                        if hasattr(part, 'root') and hasattr(part.root, 'text'):
-                            texts.append(part.root.text)
-                    return ' '.join(texts)
+            try:
+                parts = response.result.parts
+            except AttributeError:
+                # Fallback: try to convert to string
+                return str(response)
             
-            # Fallback: try to convert to string
-            return str(response)
+            texts = []
+            append = texts.append
+            for part in parts:
+                try:
+                    append(part.root.text)
+                except AttributeError:
+                    continue
+            return ' '.join(texts)
         except Exception as e:
             print(f"Warning: Failed to extract message text: {e}")
             return str(response)
@@ -351,28 +398,68 @@ class TACEvaluator:
         """
         tasks = task_selector.select_tasks()
         task_images = task_selector.get_task_images()
+        # Pair names and images once so dispatch order is fixed for the whole batch
+        task_pairs = list(zip(tasks, task_images))
         
         print(f"\n{'='*60}")
         print(f"Starting evaluation of {len(tasks)} tasks")
         print(f"White agent: {self.white_agent_url}")
         print(f"{'='*60}\n")
         
-        # Wait for white agent to be ready
-        print("Waiting for white agent to be ready...")
-        if not await wait_agent_ready(self.white_agent_url):
+        # Wait for the white agent while pulling every distinct image; the two are independent
+        print(f"Waiting for white agent and preparing {len(set(task_images))} Docker image(s)...")
+        agent_ready, self._image_available = await asyncio.gather(
+            wait_agent_ready(self.white_agent_url),
+            self.docker_manager.pull_images(task_images),
+        )
+        if not agent_ready:
             raise RuntimeError(f"White agent at {self.white_agent_url} is not ready")
         
-        # Evaluate each task
-        all_results = []
-        total_start_time = time.time()
+        # Evaluate tasks, at most max_concurrent_tasks at a time
+        semaphore = asyncio.Semaphore(self.max_concurrent_tasks)
         
-        for task_name, task_image in zip(tasks, task_images):
-            result = await self.evaluate_task(
-                task_name,
-                task_image,
-                context_id=context_id,
-            )
-            all_results.append(result)
+        async def run_task(task_name: str, task_image: str) -> Dict[str, Any]:
+            # Named up front so a timed-out task's containers can still be removed
+            npc_container_name = _npc_container_name(task_name)
+            eval_container_name = _eval_container_name(task_name)
+            async with semaphore:
+                try:
+                    return await asyncio.wait_for(
+                        self.evaluate_task(
+                            task_name,
+                            task_image,
+                            context_id=context_id,
+                            npc_container_name=npc_container_name,
+                            eval_container_name=eval_container_name,
+                        ),
+                        timeout=self.per_task_timeout,
+                    )
+                except asyncio.TimeoutError:
+                    print(f"✗ Task {task_name} timed out after {self.per_task_timeout:.0f}s")
+                    # Both are normally removed inside evaluate_task (the eval one by --rm);
+                    # cancellation already stopped the docker client that was running
+                    await self.docker_manager.cleanup_containers(
+                        [npc_container_name, eval_container_name]
+                    )
+                    return {
+                        "task_name": task_name,
+                        "task_image": task_image,
+                        "status": "failed",
+                        "elapsed_time": self.per_task_timeout,
+                        "error": f"Task timed out after {self.per_task_timeout:.0f}s",
+                    }
+        
+        total_start_time = time.time()
+        try:
+            async with httpx.AsyncClient(timeout=httpx.Timeout(600.0, connect=10.0)) as http_client:
+                self._http_client = http_client
+                all_results = await asyncio.gather(
+                    *(run_task(task_name, task_image) for task_name, task_image in task_pairs)
+                )
+        finally:
+            self._http_client = None
+            # Remove warm evaluation containers once the batch is done
+            await self.docker_manager.shutdown_pool()
         
         total_elapsed = time.time() - total_start_time
         
@@ -385,23 +472,27 @@ class TACEvaluator:
     
     def _aggregate_results(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Aggregate results from multiple tasks."""
-        completed = [r for r in results if r["status"] == "completed"]
-        failed = [r for r in results if r["status"] == "failed"]
-        
+        completed = 0
+        failed = 0
         total_score = 0
         total_possible = 0
         
-        for result in completed:
-            eval_result = result.get("evaluation", {})
-            final_score = eval_result.get("final_score", {})
-            total_score += final_score.get("result", 0)
-            total_possible += final_score.get("total", 0)
+        # Single pass: tally statuses and scores together
+        for result in results:
+            status = result["status"]
+            if status == "completed":
+                completed += 1
+                final_score = result.get("evaluation", {}).get("final_score", {})
+                total_score += final_score.get("result", 0)
+                total_possible += final_score.get("total", 0)
+            elif status == "failed":
+                failed += 1
         
         return {
             "summary": {
                 "total_tasks": len(results),
-                "completed": len(completed),
-                "failed": len(failed),
+                "completed": completed,
+                "failed": failed,
                 "total_score": total_score,
                 "total_possible": total_possible,
                 "overall_score": total_score / total_possible if total_possible > 0 else 0.0,
@@ -410,6 +501,19 @@ class TACEvaluator:
         }
 
 
+def _extract_tag(message: str, tag: str) -> Optional[str]:
+    """Return the stripped text between <tag> and </tag>, or None if either is missing."""
+    open_tag = f"<{tag}>"
+    start = message.find(open_tag)
+    if start < 0:
+        return None
+    start += len(open_tag)
+    end = message.find(f"</{tag}>", start)
+    if end < 0:
+        return None
+    return message[start:end].strip()
+
+
 def parse_evaluation_request(message: str) -> Dict[str, Any]:
     """
     Parse evaluation request from message.
@@ -432,16 +536,16 @@ def parse_evaluation_request(message: str) -> Dict[str, Any]:
     </evaluation_config>
     """
     # Extract white agent URL
-    url_match = re.search(r'<white_agent_url>\s*(.*?)\s*</white_agent_url>', message, re.DOTALL)
-    white_agent_url = url_match.group(1).strip() if url_match else None
+    white_agent_url = _extract_tag(message, "white_agent_url")
     
     # Extract evaluation config
-    config_match = re.search(r'<evaluation_config>\s*(.*?)\s*</evaluation_config>', message, re.DOTALL)
-    config_str = config_match.group(1).strip() if config_match else "{}"
+    config_str = _extract_tag(message, "evaluation_config")
+    if config_str is None:
+        config_str = "{}"
     
     try:
-        config = json.loads(config_str)
-    except json.JSONDecodeError:
+        config = fast_json.loads(config_str)
+    except fast_json.JSONDecodeError:
         config = {}
     
     return {
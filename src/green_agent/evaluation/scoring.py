@@ -1,13 +1,23 @@
 """Custom scoring strategies for TAC evaluation."""
 
-from typing import List, Callable, Optional
-import sys
-import os
+from __future__ import annotations
 
-# Add TAC framework to path (now 2 levels up from evaluation/)
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../../external/tac/workspaces/base_image"))
+from typing import TYPE_CHECKING, List, Callable, Optional, Tuple
 
-from scoring import Checkpoint, Result
+if TYPE_CHECKING:
+    # TAC's Checkpoint (external/tac/workspaces/base_image/scoring.py) is only
+    # needed for annotations; the strategies just read .total and .result
+    from scoring import Checkpoint
+
+
+def _checkpoint_sums(checkpoints: List[Checkpoint]) -> Tuple[int, int]:
+    """Return (total, result) summed over checkpoints in a single pass."""
+    total = 0
+    result = 0
+    for cp in checkpoints:
+        total += cp.total
+        result += cp.result
+    return total, result
 
 
 def weighted_checkpoint_scoring(weights: List[float]) -> Callable[[List[Checkpoint]], dict]:
@@ -20,23 +30,26 @@ def weighted_checkpoint_scoring(weights: List[float]) -> Callable[[List[Checkpoi
     Returns:
         Scoring function
     """
+    # Normalize weights to sum to 1.0 once, rather than on every call
+    total_weight = sum(weights)
+    normalized_weights = [w / total_weight for w in weights] if total_weight else []
+    
     def scoring_strategy(checkpoints: List[Checkpoint]) -> dict:
         if not checkpoints:
             return {"total": 0, "result": 0}
         
-        if len(weights) != len(checkpoints):
+        if len(normalized_weights) != len(checkpoints):
             # If weights don't match, use equal weights
             weights_normalized = [1.0 / len(checkpoints)] * len(checkpoints)
         else:
-            # Normalize weights to sum to 1.0
-            total_weight = sum(weights)
-            weights_normalized = [w / total_weight for w in weights]
+            weights_normalized = normalized_weights
         
-        total = sum(cp.total for cp in checkpoints)
-        result = sum(
-            (cp.result / cp.total) * cp.total * weight
-            for cp, weight in zip(checkpoints, weights_normalized)
-        )
+        # Single pass over the checkpoints for both sums
+        total = 0
+        result = 0.0
+        for cp, weight in zip(checkpoints, weights_normalized):
+            total += cp.total
+            result += cp.result * weight
         
         return {"total": total, "result": int(result)}
     
@@ -55,8 +68,7 @@ def time_penalized_scoring(max_time_seconds: float, penalty_factor: float = 0.1)
         Scoring function that takes (checkpoints, elapsed_time)
     """
     def scoring_strategy(checkpoints: List[Checkpoint], elapsed_time: float) -> dict:
-        base_total = sum(cp.total for cp in checkpoints)
-        base_result = sum(cp.result for cp in checkpoints)
+        base_total, base_result = _checkpoint_sums(checkpoints)
         
         # Calculate time penalty
         if elapsed_time > max_time_seconds:
@@ -86,12 +98,8 @@ def efficiency_scoring(action_count: int, optimal_action_count: int) -> float:
     Returns:
         Efficiency score (0.0 to 1.0)
     """
-    if action_count <= optimal_action_count:
-        return 1.0
-    
-    # Exponential decay: efficiency decreases as actions increase
-    ratio = optimal_action_count / action_count
-    return ratio
+    # Efficiency falls off as optimal/actual once the agent exceeds the optimum
+    return 1.0 if action_count <= optimal_action_count else optimal_action_count / action_count
 
 
 def composite_scoring(
@@ -117,8 +125,7 @@ def composite_scoring(
         max_time: float,
     ) -> dict:
         # Normalize checkpoint score
-        checkpoint_total = sum(cp.total for cp in checkpoints)
-        checkpoint_result = sum(cp.result for cp in checkpoints)
+        checkpoint_total, checkpoint_result = _checkpoint_sums(checkpoints)
         checkpoint_normalized = checkpoint_result / checkpoint_total if checkpoint_total > 0 else 0.0
         
         # Normalize time score (faster = better)
@@ -160,8 +167,7 @@ def quality_bonus_scoring(quality_score: float, bonus_factor: float = 0.1) -> Ca
         Scoring function
     """
     def scoring_strategy(checkpoints: List[Checkpoint]) -> dict:
-        base_total = sum(cp.total for cp in checkpoints)
-        base_result = sum(cp.result for cp in checkpoints)
+        base_total, base_result = _checkpoint_sums(checkpoints)
         
         # Apply quality bonus
         bonus = base_result * quality_score * bonus_factor
@@ -1,5 +1,7 @@
 """Task selection logic for TAC evaluation."""
 
+import functools
+from types import MappingProxyType
 from typing import List, Dict, Optional
 
 # current working tasks w/ full scores:
@@ -182,7 +184,14 @@ ALL_TASKS_BY_CATEGORY = {
     ],
 }
 
+# Read-only after import: freeze the lists and build the name lookup once
+ALL_TASKS_BY_CATEGORY = MappingProxyType(
+    {category: tuple(tasks) for category, tasks in ALL_TASKS_BY_CATEGORY.items()}
+)
+ALL_TASK_NAMES = frozenset(task for tasks in ALL_TASKS_BY_CATEGORY.values() for task in tasks)
+
 # Helper functions (minimal - used by evaluator/agent)
+@functools.lru_cache(maxsize=512)
 def get_task_image_name(task_name: str, version: str = "1.0.0") -> str:
     """Convert task name to Docker image name."""
     return f"ghcr.io/theagentcompany/{task_name}-image:{version}"
@@ -198,13 +207,17 @@ class TaskSelector:
         return self.task_names
     
     def get_task_images(self) -> List[str]:
-        return [get_task_image_name(task) for task in self.select_tasks()]
+        return list(map(get_task_image_name, self.select_tasks()))
 
 
 def parse_task_config(config: Dict) -> TaskSelector:
     """Parse task configuration."""
-    return TaskSelector(task_names=config.get("task_names", []))
+    task_names = config.get("task_names", [])
+    unknown = [task for task in task_names if task not in ALL_TASK_NAMES]
+    if unknown:
+        print(f"⚠️  Unknown task name(s), image pulls may fail: {', '.join(unknown)}")
+    return TaskSelector(task_names=task_names)
 
 
 # Legacy exports for compatibility
-TASK_SUBSETS = {}
+TASK_SUBSETS = MappingProxyType({})
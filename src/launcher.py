@@ -4,32 +4,61 @@ import asyncio
 import json
 import multiprocessing
 import os
+import sys
 from pathlib import Path
-from src.green_agent import start_green_agent
-from src.white_agent import start_white_agent
-from src.utils.a2a_client import send_message_to_agent, wait_agent_ready
+from dotenv import dotenv_values
+from src.utils.a2a_client import send_message_to_agent, wait_agent_ready, close_clients, extract_response_text
+
+
+# Template values that mean "not configured"; dotenv yields None for a bare key
+_ENV_PLACEHOLDERS = frozenset({'your-openai-api-key-here', 'your_api_key', '', None})
 
 
 def load_env_file():
     """Load .env file from project root."""
     env_file = Path(__file__).parent.parent / ".env"
-    if env_file.exists():
-        with open(env_file) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    # Don't override existing environment variables (from terminal)
-                    # Only set if not already set
-                    if key not in os.environ:
-                        # Skip placeholder values
-                        if value not in ['your-openai-api-key-here', 'your_api_key', '']:
-                            os.environ[key] = value
+    # python-dotenv parses the file in one pass (quotes, comments, export prefixes)
+    for key, value in dotenv_values(env_file).items():
+        # Don't override existing environment variables (from terminal)
+        # Only set if not already set
+        if key not in os.environ:
+            # Skip placeholder values
+            if value not in _ENV_PLACEHOLDERS:
+                os.environ[key] = value
 
 
 # Load environment variables at import time
 load_env_file()
 
+# launch_evaluation imports the agents before starting them, so on Linux a forked child
+# inherits them instead of re-importing the whole stack (Python 3.14 would otherwise
+# default to forkserver).
+# Other platforms keep their default start method, since fork is unsafe on macOS.
+_MP_CONTEXT = multiprocessing.get_context("fork" if sys.platform == "linux" else None)
+
+# Evaluation config sent to the green agent; static, so serialize it once
+TASK_CONFIG = {
+    "task_names": [
+        "pm-create-channel-new-leader"
+    ],
+}
+TASK_CONFIG_JSON = json.dumps(TASK_CONFIG, indent=2)
+
+# Assessment request in the tag format parse_evaluation_request expects
+TASK_TEXT_TEMPLATE = """
+Your task is to begin an assessment of the white agent located at:
+
+<white_agent_url>
+{white_url}/
+</white_agent_url>
+
+Use the following evaluation configuration:
+
+<evaluation_config>
+{config_json}
+</evaluation_config>
+    """
+
 
 async def test_send_message(agent_url="http://localhost:9001", message="Hello from launcher!"):
     """Test sending a message to an agent."""
@@ -43,101 +72,76 @@ async def test_send_message(agent_url="http://localhost:9001", message="Hello fr
             message
         )
         print("✅ Success! Response received:")
-        # Extract the message text from the response
-        if hasattr(response, 'result') and hasattr(response.result, 'parts'):
-            message_text = ' '.join([
-                part.root.text for part in response.result.parts 
-                if hasattr(part, 'root') and hasattr(part.root, 'text')
-            ])
-            print(f"Agent replied: {message_text}")
-        else:
-            print(response)
+        print(f"Agent replied: {extract_response_text(response, ' ')}")
         return response
     except Exception as e:
         print(f"❌ Error: {e}")
         import traceback
         traceback.print_exc()
         return None
+    finally:
+        await close_clients()
 
 
-async def launch_evaluation():
-    """Launch the complete evaluation workflow."""
-    # Start green agent
+async def launch_evaluation(task_config=None, timeout=600.0):
+    """
+    Launch the complete evaluation workflow.
+    
+    Args:
+        task_config: Evaluation config sent to the green agent (defaults to TASK_CONFIG)
+        timeout: Seconds to wait for the green agent's response
+    """
+    # Imported here so test_send_message doesn't load the agent and LLM stacks
+    from src.green_agent import start_green_agent
+    from src.white_agent import start_white_agent
+    
+    config_json = TASK_CONFIG_JSON if task_config is None else json.dumps(task_config, indent=2)
+    
+    # Start both agents up front; they are independent, so they can boot in parallel
     print("Launching green agent...")
     green_address = ("localhost", 9001)
     green_url = f"http://{green_address[0]}:{green_address[1]}"
     
-    p_green = multiprocessing.Process(
+    p_green = _MP_CONTEXT.Process(
         target=start_green_agent,
         args=(green_address[0], green_address[1])
     )
     p_green.start()
     
-    assert await wait_agent_ready(green_url), "Green agent not ready in time"
-    print("Green agent is ready.")
-    
-    # Start white agent
     print("Launching white agent...")
     white_address = ("localhost", 9002)
     white_url = f"http://{white_address[0]}:{white_address[1]}"
     
-    p_white = multiprocessing.Process(
+    p_white = _MP_CONTEXT.Process(
         target=start_white_agent,
         args=("agent_company_white_agent", white_address[0], white_address[1])
     )
     p_white.start()
     
-    assert await wait_agent_ready(white_url), "White agent not ready in time"
+    green_ready, white_ready = await asyncio.gather(
+        wait_agent_ready(green_url),
+        wait_agent_ready(white_url),
+    )
+    assert green_ready, "Green agent not ready in time"
+    print("Green agent is ready.")
+    assert white_ready, "White agent not ready in time"
     print("White agent is ready.")
 
     # Send the task description to green agent
     print("Sending task description to green agent...")
-    task_config = {
-        "task_names": [
-            "pm-create-channel-new-leader"
-        ],
-    }
-    
-    task_text = f"""
-Your task is to begin an assessment of the white agent located at:
-
-<white_agent_url>
-{white_url}/
-</white_agent_url>
-
-Use the following evaluation configuration:
-
-<evaluation_config>
-{json.dumps(task_config, indent=2)}
-</evaluation_config>
-    """
+    task_text = TASK_TEXT_TEMPLATE.format(white_url=white_url, config_json=config_json)
     
     print("Task description:")
     print(task_text)
     print("Sending...")
     
     try:
-        # 10 minute timeout - increased for complex tasks with Vision API
-        response = await send_message_to_agent(green_url, task_text, timeout=600.0)
-        
-        # Extract and print response
-        print("\n" + "=" * 60)
-        print("GREEN AGENT RESPONSE:")
-        print("=" * 60)
-        
-        # Extract response text
-        full_text = []
-        if hasattr(response, 'result') and hasattr(response.result, 'parts'):
-            for part in response.result.parts:
-                if hasattr(part, 'root') and hasattr(part.root, 'text'):
-                    full_text.append(part.root.text)
-        
-        if not full_text:
-            # Fallback: convert response to string
-            full_text = [str(response)]
+        # 10 minute default timeout - increased for complex tasks with Vision API
+        response = await send_message_to_agent(green_url, task_text, timeout=timeout)
         
-        complete_response = '\n'.join(full_text)
-        print(complete_response)
+        # Extract and print response; one print so the banner and body go out in a single write
+        complete_response = extract_response_text(response)
+        print(f"\n{'=' * 60}\nGREEN AGENT RESPONSE:\n{'=' * 60}\n{complete_response}")
         
         # Save results to file (use absolute path to project root)
         project_root = Path(__file__).parent.parent
@@ -161,6 +165,7 @@ Use the following evaluation configuration:
     p_green.join()
     p_white.terminate()
     p_white.join()
+    await close_clients()
     print("Agents terminated.")
 
 
@@ -168,7 +173,6 @@ async def main():
     """Main entry point for launcher."""
     # For testing, use test_send_message
     # For full evaluation, use launch_evaluation
-    import sys
     if len(sys.argv) > 1 and sys.argv[1] == "eval":
         await launch_evaluation()
     else:
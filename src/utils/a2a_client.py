@@ -1,50 +1,109 @@
 import asyncio
 import httpx
-import uuid
+import itertools
+import os
+import secrets
+import weakref
 from a2a.client import A2AClient
 from a2a.types import SendMessageRequest, MessageSendParams, Message, Part, TextPart, Role
 
 
+def _reset_id_source() -> None:
+    """Pick a fresh random prefix and restart the counter used for message/request IDs."""
+    global _id_prefix, _id_counter
+    _id_prefix = secrets.token_hex(8)
+    _id_counter = itertools.count()
+
+
+_reset_id_source()
+if hasattr(os, "register_at_fork"):
+    # Forked agent processes must not replay the parent's ID sequence
+    os.register_at_fork(after_in_child=_reset_id_source)
+
+
+def _new_id() -> str:
+    """Return an ID unique within this process and, via the random prefix, across processes."""
+    return f"{_id_prefix}-{next(_id_counter):x}"
+
+
+# One pooled client per event loop: httpx connections cannot be shared across loops,
+# and main.py / the launcher may call asyncio.run() more than once per process
+_shared_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def _get_shared_client() -> httpx.AsyncClient:
+    """Return the pooled httpx client for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    client = _shared_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+        _shared_clients[loop] = client
+    return client
+
+
+async def close_clients() -> None:
+    """Close the pooled httpx client for the running event loop, if one was created."""
+    client = _shared_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
 async def wait_agent_ready(
     agent_url: str,
     max_attempts: int = 30,
     delay: float = 1.0,
-    timeout: float = 5.0
+    timeout: float = 5.0,
+    initial_delay: float = 0.05,
 ) -> bool:
     """
     Wait for an agent to be ready by checking its agent card endpoint.
     
     Args:
         agent_url: The base URL of the agent
-        max_attempts: Maximum number of attempts to check
-        delay: Delay between attempts in seconds
+        max_attempts: Sets the total wait, (max_attempts - 1) * delay seconds, the same
+            budget as polling every `delay` seconds; probes are more frequent early on
+        delay: Maximum delay between attempts in seconds
         timeout: HTTP request timeout in seconds
+        initial_delay: First delay in seconds; doubles after each attempt up to delay
     
     Returns:
         True if agent is ready, False otherwise
     """
     agent_card_url = f"{agent_url.rstrip('/')}/.well-known/agent-card.json"
+    client = _get_shared_client()
     
-    for attempt in range(max_attempts):
+    # Bounded by elapsed time, not attempts, so the backoff doesn't shorten the wait
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + (max_attempts - 1) * delay
+    attempt = 0
+    while True:
+        error = None
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.get(agent_card_url)
-                if response.status_code == 200:
-                    print(f"✓ Agent ready at {agent_url}")
-                    return True
+            # HEAD avoids transferring the card; fall back to GET if the server rejects it
+            response = await client.head(agent_card_url, timeout=timeout)
+            if response.status_code == 405:
+                response = await client.get(agent_card_url, timeout=timeout)
+            if response.status_code == 200:
+                print(f"✓ Agent ready at {agent_url}")
+                return True
         except Exception as e:
-            if attempt < max_attempts - 1:
-                print(f"Waiting for agent at {agent_url}... (attempt {attempt + 1}/{max_attempts})")
-            else:
-                print(f"✗ Agent not ready: {e}")
+            error = e
         
-        if attempt < max_attempts - 1:
-            await asyncio.sleep(delay)
-    
-    return False
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            if error is not None:
+                print(f"✗ Agent not ready: {error}")
+            return False
+        if error is not None:
+            print(f"Waiting for agent at {agent_url}... (attempt {attempt + 1})")
+        # Exponential backoff so an agent that is nearly up is detected quickly
+        await asyncio.sleep(min(delay, initial_delay * (2 ** attempt), remaining))
+        attempt += 1
 
 
-async def send_message_to_agent(url, message, context_id=None, timeout=300.0):
+async def send_message_to_agent(url, message, context_id=None, timeout=300.0, httpx_client=None):
     """
     Send a message to an A2A agent.
     
@@ -53,25 +112,55 @@ async def send_message_to_agent(url, message, context_id=None, timeout=300.0):
         message: Message text
         context_id: Optional context ID
         timeout: Request timeout in seconds (default 5 minutes for evaluations)
+        httpx_client: Optional httpx.AsyncClient to send through; the module's pooled
+            client for the running event loop is used when omitted
     """
-    async with httpx.AsyncClient(timeout=timeout) as httpx_client:
-        client = A2AClient(httpx_client=httpx_client, url=url)
-        
-        # Create a user message
-        user_message = Message(
-            message_id=str(uuid.uuid4()),
-            parts=[Part(root=TextPart(text=message))],
-            role=Role.user
-        )
-        
-        # Create MessageSendParams
-        params = MessageSendParams(message=user_message)
-        
-        # Create the request
-        request = SendMessageRequest(
-            id=str(uuid.uuid4()),
-            params=params,
-            context_id=context_id
-        )
-        
-        return await client.send_message(request)
\ No newline at end of file
+    if httpx_client is None:
+        httpx_client = _get_shared_client()
+    
+    client = A2AClient(httpx_client=httpx_client, url=url)
+    
+    # Create a user message
+    user_message = Message(
+        message_id=_new_id(),
+        parts=[Part(root=TextPart(text=message))],
+        role=Role.user
+    )
+    
+    # Create MessageSendParams
+    params = MessageSendParams(message=user_message)
+    
+    # Create the request
+    request = SendMessageRequest(
+        id=_new_id(),
+        params=params,
+        context_id=context_id
+    )
+    
+    # Per-request timeout so a shared client can serve calls with different limits
+    return await client.send_message(request, http_kwargs={"timeout": timeout})
+
+
+def extract_response_text(response, separator="\n"):
+    """
+    Join the text parts of an A2A send_message response.
+    
+    Args:
+        response: Response returned by send_message_to_agent
+        separator: String placed between text parts
+    
+    Returns:
+        The joined text, or str(response) if it carries no text parts
+    """
+    try:
+        parts = response.result.parts
+    except AttributeError:
+        return str(response)
+    
+    texts = []
+    for part in parts:
+        try:
+            texts.append(part.root.text)
+        except AttributeError:
+            continue
+    return separator.join(texts) if texts else str(response)
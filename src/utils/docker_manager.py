@@ -1,56 +1,384 @@
 """Docker container management for TAC evaluation."""
 
+import io
 import os
 import subprocess
+import tarfile
 import asyncio
-import json
+import atexit
+import collections
+import functools
 import tempfile
 import platform
-from typing import Optional, Dict, Any
+import shlex
+import shutil
+import uuid
+import weakref
+from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
 
+from . import fast_json
+
+# Points the-agent-company.com at the TAC services host inside a container
+HOSTS_SETUP_SCRIPT = (
+    "echo '=== Setting up hostname resolution ===' && "
+    "SERVICE_IP=$(getent hosts ${SERVER_HOSTNAME:-localhost} | awk '{print $1}' || echo 'host-gateway') && "
+    "echo \"$SERVICE_IP the-agent-company.com\" >> /etc/hosts && "
+    "echo 'Hostname resolution configured'"
+)
+
+# Evaluation script; fill in shell-quoted paths with EVAL_SCRIPT_TEMPLATE.format(...).
+# For external agents (running on host), we SKIP the reset.sh because the agent has
+# already modified the services and we don't want to undo that
+EVAL_SCRIPT_TEMPLATE = (
+    "echo '=== Skipping reset.sh (external agent mode) ===' && "
+    "echo '=== Starting eval.py ===' && "
+    "time python_default /utils/eval.py "
+    "--trajectory_path {trajectory_path} "
+    "--result_path {output_path} && "
+    "echo '=== Evaluation completed ==='"
+)
+
+# Read size for streamed command output; lines are split by hand, so any line length works
+STREAM_CHUNK_SIZE = 1 << 16
+
+# Output lines kept from long-running init/eval commands
+COMMAND_TAIL_LINES = 1000
+
+# Registry pulls: max running at once per manager, and retries when rate limited
+PULL_CONCURRENCY = max(1, int(os.getenv("TAC_PULL_CONCURRENCY", "4")))
+PULL_RATE_LIMIT_RETRIES = 4
+
+# Task instructions extracted from images, keyed by image ID (images are immutable)
+INSTRUCTION_CACHE_DIR = Path.home() / ".cache" / "tac" / "instructions"
+
+# Host facts, probed once per process (platform.processor() spawns a subprocess on some systems)
+# Check if we need platform emulation (Apple Silicon)
+NEEDS_PLATFORM_FLAG = platform.machine() == "arm64" or platform.processor() == "arm"
+# On Mac, host networking doesn't work the same way
+IS_MAC = platform.system() == "Darwin"
+
+
+def _write_text_atomic(path: Path, text: str) -> None:
+    """Write text to path via a temp file and rename, so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_executable(name: str) -> str:
+    """Absolute path for a command, looked up on PATH once per process."""
+    return shutil.which(name) or name
+
+
+def _shared_mount_dir(dir_a: str, dir_b: str) -> Optional[str]:
+    """
+    Return one directory that covers both dir_a and dir_b, or None if there is no safe one.
+    
+    The common ancestor is only used when it is at least two levels deep, so
+    paths that merely share "/" or "/tmp" still get separate mounts.
+    """
+    if dir_a == dir_b:
+        return dir_a
+    common = os.path.commonpath([dir_a, dir_b])
+    if len(Path(common).parts) < 3 or common == str(Path.home()):
+        return None
+    return common
+
+
+def _scratch_reset_script(mount_args: Tuple[str, ...]) -> str:
+    """
+    Shell command that empties /tmp in a pooled container between evaluations.
+    
+    Top-level /tmp entries that hold a bind mount (e.g. the host output dir) are
+    left alone, and rm never crosses into another filesystem.
+    """
+    targets = [
+        Path(mount_args[i + 1].split(":")[1])
+        for i in range(len(mount_args) - 1)
+        if mount_args[i] == "-v"
+    ]
+    if any(target == Path("/tmp") for target in targets):
+        # All of /tmp is host storage; nothing container-local to clear
+        return "true"
+    keep = sorted({target.parts[2] for target in targets if target.parts[1:2] == ("tmp",)})
+    excludes = "".join(f"! -name {shlex.quote(name)} " for name in keep)
+    return f"find /tmp -mindepth 1 -maxdepth 1 {excludes}-exec rm -rf --one-file-system {{}} +"
+
+
+# Every live pool, so one atexit hook can remove containers left behind at exit
+_LIVE_POOLS: "weakref.WeakSet[ContainerPool]" = weakref.WeakSet()
+
+
+@atexit.register
+def _shutdown_pools() -> None:
+    """atexit hook: remove pooled containers whose shutdown() never ran."""
+    for pool in list(_LIVE_POOLS):
+        pool._shutdown_sync()
+
+
+class ContainerPool:
+    """
+    Pool of warm evaluation containers, keyed by image, mounts and server hostname.
+    
+    Each container is started once with hostname resolution configured and then
+    kept alive with `sleep infinity`, so later evaluations of the same image only
+    pay for a `docker exec` instead of a full container start. /tmp is cleared
+    before a container is reused.
+    """
+    
+    def __init__(self, docker_manager: "DockerManager"):
+        self.docker_manager = docker_manager
+        self._idle: Dict[Tuple, List[str]] = {}
+        self._containers: set = set()
+        _LIVE_POOLS.add(self)
+    
+    async def acquire(
+        self,
+        image_name: str,
+        mount_args: List[str],
+        server_hostname: str,
+    ) -> Optional[Tuple[Tuple, str]]:
+        """
+        Get a warm container for an image, starting one if none is idle.
+        
+        Returns:
+            (pool key, container name), or None if a container could not be started
+        """
+        key = (image_name, tuple(mount_args), server_hostname)
+        idle = self._idle.get(key)
+        if idle:
+            return key, idle.pop()
+        
+        # Not named tac_eval_* so the white agent's Docker bridge never picks it up
+        container_name = f"tac_pool_{os.getpid()}_{uuid.uuid4().hex[:8]}"
+        cmd = self.docker_manager._build_run_cmd(
+            image_name,
+            ["bash", "-c", f"{HOSTS_SETUP_SCRIPT} && exec sleep infinity"],
+            env_args=["-e", f"SERVER_HOSTNAME={server_hostname}"],
+            mount_args=mount_args,
+            container_name=container_name,
+            detach=True,
+        )
+        # Track the name before starting, so shutdown() and the exit hook cover a
+        # container that exists even if this call times out or is cancelled
+        self._containers.add(container_name)
+        result = await self.docker_manager._run_command(
+            cmd, timeout=120, container_name=container_name
+        )
+        if result["returncode"] != 0:
+            print(f"⚠️  Could not start warm container for {image_name}: {result['stderr']}")
+            await self.discard(container_name)
+            return None
+        
+        return key, container_name
+    
+    async def release(self, key: Tuple, container_name: str) -> None:
+        """Reset a healthy container's scratch space and return it to the pool."""
+        result = await self.docker_manager._run_command(
+            ["docker", "exec", container_name, "bash", "-c", _scratch_reset_script(key[1])],
+            timeout=30,
+        )
+        if result["returncode"] != 0:
+            print(f"⚠️  Could not reset warm container {container_name}, removing it: {result['stderr']}")
+            await self.discard(container_name)
+            return
+        self._idle.setdefault(key, []).append(container_name)
+    
+    async def discard(self, container_name: str) -> None:
+        """Remove a container that should not be reused."""
+        self._containers.discard(container_name)
+        await self.docker_manager._run_command(["docker", "rm", "-f", container_name], timeout=30)
+    
+    async def shutdown(self) -> None:
+        """Remove all pooled containers."""
+        names = list(self._containers)
+        self._containers.clear()
+        self._idle.clear()
+        if names:
+            await self.docker_manager._run_command(["docker", "rm", "-f", *names], timeout=60)
+    
+    def _shutdown_sync(self) -> None:
+        """Remove containers left behind if shutdown() never ran (called at exit)."""
+        if self._containers:
+            subprocess.run(["docker", "rm", "-f", *self._containers], capture_output=True)
+            self._containers.clear()
+
 
 class DockerManager:
     """Manages Docker containers for TAC task evaluation."""
     
-    def __init__(self, use_host_network: bool = True):
+    def __init__(self, use_host_network: bool = True, reuse_containers: bool = False):
         """
         Initialize Docker manager.
         
         Args:
             use_host_network: Whether to use host networking (required for localhost services)
+            reuse_containers: Whether to run evaluations in pooled warm containers
         """
         self.use_host_network = use_host_network
-        # Check if we need platform emulation (Apple Silicon)
-        self.needs_platform_flag = (platform.machine() == "arm64" or platform.processor() == "arm")
-        # On Mac, host networking doesn't work the same way
-        self.is_mac = platform.system() == "Darwin"
+        self.reuse_containers = reuse_containers
+        # Warm evaluation containers; created on first use, so one-shot runs never make one
+        self._eval_pool: Optional[ContainerPool] = None
+        # Images known to be present locally, seeded by one bulk `docker images` listing
+        self._image_cache: set = set()
+        self._image_cache_loaded = False
+        self._image_cache_lock = asyncio.Lock()
+        # Optional pull-through registry mirror for ghcr.io (e.g. "localhost:5000")
+        self.registry_mirror = os.getenv("TAC_REGISTRY_MIRROR", "").rstrip("/")
+        # Pulls in progress, so concurrent callers for one image share a single pull
+        self._inflight_pulls: Dict[str, "asyncio.Task[bool]"] = {}
+        # Bounds registry pulls across pull_image and pull_images callers
+        self._pull_semaphore = asyncio.Semaphore(PULL_CONCURRENCY)
+        self.needs_platform_flag = NEEDS_PLATFORM_FLAG
+        self.is_mac = IS_MAC
+        # Instructions already loaded by this manager, keyed by image name
+        self._instructions: Dict[str, str] = {}
+        # Platform and network flags never change for a manager, so build them once
+        self._base_run_args = tuple(self._compute_run_args())
+    
+    def _compute_run_args(self) -> List[str]:
+        """Platform and network flags shared by `docker run` invocations."""
+        args = []
+        
+        # Add platform flag for Apple Silicon compatibility
+        if self.needs_platform_flag:
+            args.extend(["--platform", "linux/amd64"])
+        
+        # Note: On Mac, --network host doesn't work the same way as Linux
+        if self.use_host_network and not self.is_mac:
+            args.extend(["--network", "host"])
+        elif self.is_mac:
+            # On Mac, add host.docker.internal for accessing host services
+            args.extend(["--add-host", "the-agent-company.com:host-gateway"])
+        
+        return args
+    
+    @property
+    def eval_pool(self) -> ContainerPool:
+        """Pool of warm evaluation containers, created on first use."""
+        if self._eval_pool is None:
+            self._eval_pool = ContainerPool(self)
+        return self._eval_pool
+    
+    async def shutdown_pool(self) -> None:
+        """Remove any warm evaluation containers this manager started."""
+        if self._eval_pool is not None:
+            await self._eval_pool.shutdown()
+    
+    @staticmethod
+    def _env_args(env_vars: Dict[str, str]) -> List[str]:
+        """Turn an environment mapping into `-e KEY=VALUE` flags, skipping empty values."""
+        args = []
+        for key, value in env_vars.items():
+            if value:
+                args.extend(["-e", f"{key}={value}"])
+        return args
+    
+    def _build_run_cmd(
+        self,
+        image_name: str,
+        command: List[str],
+        env_args: List[str] = (),
+        mount_args: List[str] = (),
+        container_name: Optional[str] = None,
+        remove: bool = False,
+        detach: bool = False,
+    ) -> List[str]:
+        """Assemble a `docker run` command from the shared flags plus per-call parts."""
+        cmd = ["docker", "run"]
+        if detach:
+            cmd.append("-d")
+        cmd.extend(self._base_run_args)
+        cmd.extend(mount_args)
+        cmd.extend(env_args)
+        if remove:
+            cmd.append("--rm")
+        if container_name:
+            cmd.extend(["--name", container_name])
+        cmd.append(image_name)
+        cmd.extend(command)
+        return cmd
+    
+    async def _load_local_images(self) -> None:
+        """List all local images once and record them in the image cache."""
+        async with self._image_cache_lock:
+            if self._image_cache_loaded:
+                return
+            result = await self._run_command(
+                ["docker", "images", "--format", "{{.Repository}}:{{.Tag}}"],
+                timeout=10.0,
+            )
+            if result["returncode"] == 0:
+                self._image_cache.update(
+                    image for image in result["stdout"].split() if not image.endswith(":<none>")
+                )
+            self._image_cache_loaded = True
     
     async def pull_image(self, image_name: str) -> bool:
         """
         Pull Docker image if not already present.
         
+        Concurrent calls for the same image wait on one shared pull.
+        
         Args:
             image_name: Docker image name (e.g., "ghcr.io/theagentcompany/pm-schedule-meeting-1-image:1.0.0")
         
         Returns:
             True if image is available, False otherwise
         """
+        if image_name in self._image_cache:
+            return True
+        
+        task = self._inflight_pulls.get(image_name)
+        if task is None:
+            task = asyncio.create_task(self._pull_image(image_name))
+            self._inflight_pulls[image_name] = task
+            task.add_done_callback(lambda _: self._inflight_pulls.pop(image_name, None))
+        # Shield so one cancelled caller (e.g. a timed-out task) doesn't abort the pull for others
+        return await asyncio.shield(task)
+    
+    async def _pull_image(self, image_name: str) -> bool:
+        """Check for an image locally and pull it if missing."""
         try:
             print(f"Checking for Docker image: {image_name}")
             
-            # Check if image exists locally (with short timeout)
-            result = await self._run_command(["docker", "images", "-q", image_name], timeout=5.0)
-            if result["stdout"].strip():
+            # Check if image exists locally (one `docker images` call per manager, then cached)
+            if image_name not in self._image_cache:
+                await self._load_local_images()
+            if image_name in self._image_cache:
                 print(f"✓ Image {image_name} already exists locally")
                 return True
             
-            # Pull image (with longer timeout for network operations)
-            print(f"Pulling Docker image: {image_name}...")
-            result = await self._run_command(["docker", "pull", image_name], timeout=120.0)
+            async with self._pull_semaphore:
+                # Try the local mirror first, then fall back to the upstream registry
+                if self.registry_mirror and image_name.startswith("ghcr.io/"):
+                    if await self._pull_via_mirror(image_name):
+                        self._image_cache.add(image_name)
+                        return True
+                
+                # Pull image (with longer timeout for network operations)
+                print(f"Pulling Docker image: {image_name}...")
+                for attempt in range(PULL_RATE_LIMIT_RETRIES + 1):
+                    result = await self._run_command(["docker", "pull", image_name], timeout=120.0)
+                    if result["returncode"] == 0 or attempt == PULL_RATE_LIMIT_RETRIES:
+                        break
+                    if "toomanyrequests" not in result["stderr"].lower():
+                        break
+                    delay = 2 ** attempt
+                    print(f"  ⚠️  Registry rate limit pulling {image_name}, retrying in {delay}s...")
+                    await asyncio.sleep(delay)
             
             if result["returncode"] == 0:
                 print(f"✓ Successfully pulled {image_name}")
+                self._image_cache.add(image_name)
                 return True
             else:
                 print(f"✗ Failed to pull {image_name}: {result['stderr']}")
@@ -59,47 +387,119 @@ class DockerManager:
             print(f"✗ Docker error (Docker may not be installed): {e}")
             return False
     
+    async def _pull_via_mirror(self, image_name: str) -> bool:
+        """Pull a ghcr.io image through the registry mirror and tag it with its original name."""
+        mirror_image = f"{self.registry_mirror}/{image_name[len('ghcr.io/'):]}"
+        print(f"Pulling Docker image via mirror: {mirror_image}...")
+        result = await self._run_command(["docker", "pull", mirror_image], timeout=120.0)
+        if result["returncode"] == 0:
+            result = await self._run_command(["docker", "tag", mirror_image, image_name], timeout=10.0)
+            if result["returncode"] == 0:
+                print(f"✓ Successfully pulled {image_name} from mirror")
+                return True
+        print(f"⚠️  Mirror pull failed, falling back to upstream: {result['stderr'].strip()}")
+        return False
+    
+    async def pull_images(self, image_names: List[str]) -> Dict[str, bool]:
+        """
+        Pull several Docker images concurrently.
+        
+        At most TAC_PULL_CONCURRENCY (default 4) registry pulls run at once.
+        
+        Args:
+            image_names: Docker image names to make available locally
+        
+        Returns:
+            Mapping of image name to whether it is available
+        """
+        unique_images = list(dict.fromkeys(image_names))
+        results = await asyncio.gather(*(self.pull_image(image) for image in unique_images))
+        return dict(zip(unique_images, results))
+    
     async def get_task_instruction(self, image_name: str) -> str:
         """
         Extract task instruction from Docker image.
         
+        Instructions are cached on disk by image ID, so each image is only
+        opened once across runs, and in memory by image name, so repeat
+        lookups in one run skip the `docker image inspect` call too.
+        
         Args:
             image_name: Docker image name
         
         Returns:
             Task instruction content from /instruction/task.md
         """
+        instruction = self._instructions.get(image_name)
+        if instruction is not None:
+            return instruction
+        
+        cache_path = None
+        result = await self._run_command(
+            ["docker", "image", "inspect", "--format", "{{.Id}}", image_name], timeout=10
+        )
+        image_id = result["stdout"].strip() if result["returncode"] == 0 else ""
+        if image_id:
+            cache_path = INSTRUCTION_CACHE_DIR / f"{image_id.replace(':', '_')}.md"
+            try:
+                instruction = await asyncio.to_thread(cache_path.read_text, encoding="utf-8")
+                print(f"✓ Using cached task instruction for {image_name} ({len(instruction)} chars)")
+                self._instructions[image_name] = instruction
+                return instruction
+            except OSError:
+                pass
+        
+        instruction = await self._extract_task_instruction(image_name)
+        if instruction is None:
+            return f"Complete the task in /instruction/task.md"
+        
+        if cache_path is not None:
+            try:
+                await asyncio.to_thread(_write_text_atomic, cache_path, instruction)
+            except OSError as e:
+                print(f"⚠️  Could not cache task instruction: {e}")
+        self._instructions[image_name] = instruction
+        return instruction
+    
+    async def _extract_task_instruction(self, image_name: str) -> Optional[str]:
+        """Copy /instruction/task.md out of the image; returns None on failure."""
         print(f"Extracting task instruction from {image_name}...")
         
-        # Create a temporary container to read the file
-        container_name = f"tac_instruction_{os.getpid()}"
+        # Create (but never start) a temporary container and copy the file out of it
+        container_name = f"tac_instruction_{os.getpid()}_{uuid.uuid4().hex[:8]}"
         
         try:
-            # Build docker run command
-            cmd = ["docker", "run", "--name", container_name, "--rm"]
+            cmd = ["docker", "create", "--name", container_name]
             
             # Add platform flag for Apple Silicon compatibility
             if self.needs_platform_flag:
                 cmd.extend(["--platform", "linux/amd64"])
             
-            cmd.extend([
-                image_name,
-                "cat", "/instruction/task.md"
-            ])
+            cmd.extend([image_name, "true"])
             
             result = await self._run_command(cmd, timeout=30)
+            if result["returncode"] != 0:
+                print(f"✗ Failed to get task instruction: {result['stderr']}")
+                return None
             
-            if result["returncode"] == 0:
-                instruction = result["stdout"]
-                print(f"✓ Retrieved task instruction ({len(instruction)} chars)")
-                return instruction
-            else:
+            # `docker cp ... -` writes a tar archive of the file to stdout
+            cp_cmd = ["docker", "cp", f"{container_name}:/instruction/task.md", "-"]
+            result = await self._run_command(cp_cmd, timeout=30, decode=False)
+            if result["returncode"] != 0:
                 print(f"✗ Failed to get task instruction: {result['stderr']}")
-                return f"Complete the task in /instruction/task.md"
+                return None
+            
+            with tarfile.open(fileobj=io.BytesIO(result["stdout"])) as archive:
+                member = archive.extractfile(archive.next())
+                instruction = member.read().decode('utf-8', errors='replace')
+            print(f"✓ Retrieved task instruction ({len(instruction)} chars)")
+            return instruction
         
         except Exception as e:
             print(f"✗ Error getting task instruction: {e}")
-            return f"Complete the task in /instruction/task.md"
+            return None
+        finally:
+            await self._run_command(["docker", "rm", container_name], timeout=30)
     
     async def initialize_task(
         self,
@@ -130,34 +530,23 @@ class DockerManager:
             "LITELLM_MODEL": env_llm_config.get("model", "openai/gpt-4o"),
         }
         
-        # Build docker run command
-        cmd = ["docker", "run"]
+        env_args = self._env_args(env_vars)
         
-        # Add platform flag for Apple Silicon compatibility
-        if self.needs_platform_flag:
-            cmd.extend(["--platform", "linux/amd64"])
-        
-        # Note: On Mac, --network host doesn't work the same way as Linux
-        if self.use_host_network and not self.is_mac:
-            cmd.extend(["--network", "host"])
-        elif self.is_mac:
-            # On Mac, add hostname mapping for accessing host services
-            cmd.extend(["--add-host", "the-agent-company.com:host-gateway"])
-        
-        # Add environment variables
-        for key, value in env_vars.items():
-            if value:
-                cmd.extend(["-e", f"{key}={value}"])
-        
-        cmd.extend([
-            "--name", container_name,
+        cmd = self._build_run_cmd(
             image_name,
-            "bash", "/utils/init.sh"
-        ])
+            ["bash", "/utils/init.sh"],
+            env_args=env_args,
+            container_name=container_name,
+        )
         
         # Run initialization (this can take up to 10 minutes)
         print("Running /utils/init.sh (this may take several minutes)...")
-        result = await self._run_command(cmd, timeout=900)  # 15 minute timeout
+        result = await self._run_command(
+            cmd,
+            timeout=900,  # 15 minute timeout
+            tail_lines=COMMAND_TAIL_LINES,
+            container_name=container_name,
+        )
         
         if result["returncode"] == 0:
             print(f"✓ Task environment initialized successfully")
@@ -209,6 +598,7 @@ class DockerManager:
         }
         
         # Build docker run command - run init.sh and keep container alive
+        # (no host networking here: NPCs reach RocketChat through BOT_URL)
         cmd = ["docker", "run", "-d"]  # detached mode
         
         # Add platform flag for Apple Silicon compatibility
@@ -220,9 +610,7 @@ class DockerManager:
             cmd.extend(["--add-host", "the-agent-company.com:host-gateway"])
         
         # Add environment variables
-        for key, value in env_vars.items():
-            if value:
-                cmd.extend(["-e", f"{key}={value}"])
+        cmd.extend(self._env_args(env_vars))
         
         cmd.extend([
             "--name", container_name,
@@ -281,8 +669,9 @@ class DockerManager:
         """
         Run TAC evaluation in Docker container.
         
-        This runs both initialization (/utils/init.sh) and evaluation (/utils/eval.py)
-        in sequence within the same container execution.
+        Only /utils/eval.py runs here. /utils/init.sh (which resets the shared TAC
+        services) is skipped on purpose, since the agent has already changed those
+        services and the evaluators need to see that state.
         
         Args:
             image_name: Docker image name
@@ -298,9 +687,9 @@ class DockerManager:
         """
         print(f"Running evaluation in container {container_name}...")
         
-        # Ensure paths are absolute
-        trajectory_path = os.path.abspath(trajectory_path)
-        output_path = os.path.abspath(output_path)
+        # Ensure paths are absolute and symlink-free, so equivalent directories compare equal
+        trajectory_path = os.path.realpath(trajectory_path)
+        output_path = os.path.realpath(output_path)
         
         # Build environment variables
         env_vars = {
@@ -309,100 +698,90 @@ class DockerManager:
             "LITELLM_BASE_URL": env_llm_config.get("base_url", ""),
             "LITELLM_MODEL": env_llm_config.get("model", "openai/gpt-4o"),
             "DECRYPTION_KEY": decryption_key,
+            # Flush eval.py's output line by line so progress streams back as it happens
+            "PYTHONUNBUFFERED": "1",
         }
         
-        # Build docker run command
-        cmd = ["docker", "run"]
-        
-        # Add platform flag for Apple Silicon compatibility
-        if self.needs_platform_flag:
-            cmd.extend(["--platform", "linux/amd64"])
-        
-        # Note: On Mac, --network host doesn't work the same way as Linux
-        # The init.sh script should handle hostname resolution
-        if self.use_host_network and not self.is_mac:
-            cmd.extend(["--network", "host"])
-        elif self.is_mac:
-            # On Mac, add host.docker.internal for accessing host services
-            cmd.extend(["--add-host", "the-agent-company.com:host-gateway"])
-        
         # Mount /tmp/workspace as /workspace so agent output can be seen by evaluation
-        cmd.extend(["-v", "/tmp/workspace:/workspace:rw"])
+        mount_args = ["-v", "/tmp/workspace:/workspace:rw"]
         
         # Mount trajectory and output directories
-        # If they're in the same directory, only mount once
+        # If they're in the same directory or share a close ancestor, only mount once
         trajectory_dir = os.path.dirname(trajectory_path)
         output_dir = os.path.dirname(output_path)
+        shared_dir = _shared_mount_dir(trajectory_dir, output_dir)
         
-        if trajectory_dir == output_dir:
-            # Same directory - mount once as read-write
-            cmd.extend([
-                "-v", f"{trajectory_dir}:{trajectory_dir}:rw",
+        if shared_dir is not None:
+            # One read-write mount covers both
+            mount_args.extend([
+                "-v", f"{shared_dir}:{shared_dir}:rw",
             ])
         else:
             # Different directories - mount both
-            cmd.extend([
+            mount_args.extend([
                 "-v", f"{trajectory_dir}:{trajectory_dir}:ro",  # Read-only mount for trajectory
                 "-v", f"{output_dir}:{output_dir}:rw",  # Read-write mount for output
             ])
         
         # Add environment variables
-        for key, value in env_vars.items():
-            if value:
-                cmd.extend(["-e", f"{key}={value}"])
-        
-        # Run init.sh and then eval.py in sequence
-        # Using bash -c to chain commands with timing
-        # Note: For external agents (running on host), we SKIP the reset.sh
-        # because the agent has already modified the services and we don't want to undo that
-        # We create a custom init that only sets up hostnames without resetting
-        init_and_eval = (
-            f"echo '=== Setting up hostname resolution ===' && "
-            f"SERVICE_IP=$(getent hosts ${{SERVER_HOSTNAME:-localhost}} | awk '{{print $1}}' || echo 'host-gateway') && "
-            f"echo \"$SERVICE_IP the-agent-company.com\" >> /etc/hosts && "
-            f"echo 'Hostname resolution configured' && "
-            f"echo '=== Skipping reset.sh (external agent mode) ===' && "
-            f"echo '=== Starting eval.py ===' && "
-            f"time python_default /utils/eval.py "
-            f"--trajectory_path {trajectory_path} "
-            f"--result_path {output_path} && "
-            f"echo '=== Evaluation completed ==='"
+        env_args = self._env_args(env_vars)
+        
+        # Quote the paths so spaces or shell metacharacters can't break the script
+        eval_script = EVAL_SCRIPT_TEMPLATE.format(
+            trajectory_path=shlex.quote(trajectory_path),
+            output_path=shlex.quote(output_path),
         )
         
-        cmd.extend([
-            "--rm",
-            "--name", container_name,
-            image_name,
-            "bash", "-c", init_and_eval,
-        ])
+        # Prefer a warm pooled container (hostnames already configured) via docker exec
+        pooled = None
+        if self.reuse_containers:
+            pooled = await self.eval_pool.acquire(image_name, mount_args, server_hostname)
         
-        # Run evaluation (init + eval can take up to 15 minutes)
-        print(f"Running initialization and evaluation...")
-        print(f"  This includes:")
-        print(f"    1. /utils/init.sh - Resets services (can take 5-10 minutes)")
-        print(f"    2. /utils/eval.py - Runs evaluation (usually 1-2 minutes)")
+        if pooled:
+            pool_key, pooled_container = pooled
+            print(f"  Using warm container {pooled_container}")
+            cmd = ["docker", "exec", *env_args, pooled_container, "bash", "-c", eval_script]
+        else:
+            # One-shot container: set up hostnames, then run eval.py
+            cmd = self._build_run_cmd(
+                image_name,
+                ["bash", "-c", f"{HOSTS_SETUP_SCRIPT} && {eval_script}"],
+                env_args=env_args,
+                mount_args=mount_args,
+                container_name=container_name,
+                remove=True,
+            )
+        
+        # Run evaluation (eval.py usually takes 1-2 minutes; LLM-graded checkpoints can take longer)
+        print(f"Running /utils/eval.py...")
         import time as time_module
         start_time = time_module.time()
-        result = await self._run_command(cmd, timeout=900)  # 15 minute timeout
+        result = await self._run_command(
+            cmd,
+            timeout=900,  # 15 minute timeout
+            tail_lines=COMMAND_TAIL_LINES,
+            container_name=None if pooled else container_name,
+            echo_prefix=f"  [{container_name}] ",
+        )
         elapsed = time_module.time() - start_time
         print(f"  Total time: {elapsed:.1f} seconds ({elapsed/60:.1f} minutes)")
         
+        if pooled:
+            # Only hand healthy containers back; a failed one may be in a bad state
+            if result["returncode"] == 0:
+                await self.eval_pool.release(pool_key, pooled_container)
+            else:
+                await self.eval_pool.discard(pooled_container)
+        
         if result["returncode"] != 0:
             print(f"✗ Evaluation failed: {result['stderr']}")
             print(f"stdout (last 500 chars): {result['stdout'][-500:]}")
-            # Check if it failed during init or eval
-            if "=== Starting /utils/init.sh ===" in result['stdout']:
-                if "=== init.sh completed" not in result['stdout']:
-                    print("  ⚠️  Failed during /utils/init.sh (service initialization)")
-                else:
-                    print("  ⚠️  Failed during /utils/eval.py (evaluation)")
             return None
         
         # Read and parse output JSON
         try:
             if os.path.exists(output_path):
-                with open(output_path, 'r') as f:
-                    evaluation_result = json.load(f)
+                evaluation_result = await asyncio.to_thread(fast_json.read_json, output_path)
                 print(f"✓ Evaluation completed successfully")
                 return evaluation_result
             else:
@@ -422,56 +801,147 @@ class DockerManager:
         Returns:
             True if cleanup succeeded, False otherwise
         """
+        return await self.cleanup_containers([container_name])
+    
+    async def cleanup_containers(self, container_names: List[str]) -> bool:
+        """
+        Remove several Docker containers with a single `docker rm -f`.
+        
+        Args:
+            container_names: Names of containers to remove
+        
+        Returns:
+            True if cleanup succeeded, False otherwise
+        """
+        if not container_names:
+            return True
         try:
-            result = await self._run_command(["docker", "rm", "-f", container_name])
+            result = await self._run_command(["docker", "rm", "-f", *container_names])
             return result["returncode"] == 0
         except Exception as e:
-            print(f"Warning: Failed to cleanup container {container_name}: {e}")
+            print(f"Warning: Failed to cleanup containers {', '.join(container_names)}: {e}")
             return False
     
     async def _run_command(
         self,
         cmd: list,
         timeout: Optional[float] = None,
+        decode: bool = True,
+        tail_lines: Optional[int] = None,
+        container_name: Optional[str] = None,
+        echo_prefix: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Run a shell command asynchronously.
         
         Args:
             cmd: Command and arguments as list
-            timeout: Timeout in seconds
+            timeout: Timeout in seconds; the process is killed when it expires
+            decode: Decode stdout as UTF-8; when False, stdout is returned as bytes
+            tail_lines: If set, stream output and keep only the last N lines of
+                stdout and stderr, so long-running commands use bounded memory.
+                Lines are kept as bytes and only the retained tail is decoded
+            container_name: Container started by cmd; removed if the command times out,
+                since killing the docker client leaves the container running
+            echo_prefix: If set (with tail_lines), print each output line with this
+                prefix as it arrives, so progress is visible before the command ends
         
         Returns:
             Dictionary with 'returncode', 'stdout', 'stderr'
         """
+        process = None
+        drain_future = None
         try:
+            # An absolute executable and close_fds=False let subprocess use posix_spawn
+            # instead of fork+exec (Python's own fds are non-inheritable by default)
             process = await asyncio.create_subprocess_exec(
-                *cmd,
+                _resolve_executable(cmd[0]),
+                *cmd[1:],
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
+                close_fds=False,
             )
             
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=timeout,
-            )
+            if tail_lines is None:
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(),
+                    timeout=timeout,
+                )
+                stdout = stdout.decode('utf-8', errors='replace') if decode else stdout
+                stderr = stderr.decode('utf-8', errors='replace')
+            else:
+                stdout_tail = collections.deque(maxlen=tail_lines)
+                stderr_tail = collections.deque(maxlen=tail_lines)
+                
+                def keep(line, tail):
+                    tail.append(line)
+                    if echo_prefix is not None:
+                        print(f"{echo_prefix}{line.decode('utf-8', errors='replace').rstrip()}")
+                
+                async def drain(stream, tail):
+                    # Read fixed-size chunks rather than readline(), which fails on very long lines
+                    buffer = bytearray()
+                    while chunk := await stream.read(STREAM_CHUNK_SIZE):
+                        start = 0
+                        scan = len(buffer)
+                        buffer += chunk
+                        while (end := buffer.find(b"\n", scan)) != -1:
+                            keep(bytes(buffer[start:end + 1]), tail)
+                            start = scan = end + 1
+                        del buffer[:start]
+                    if buffer:
+                        keep(bytes(buffer), tail)
+                
+                drain_future = asyncio.gather(
+                    drain(process.stdout, stdout_tail),
+                    drain(process.stderr, stderr_tail),
+                    process.wait(),
+                )
+                await asyncio.wait_for(drain_future, timeout=timeout)
+                stdout = b"".join(stdout_tail)
+                stdout = stdout.decode('utf-8', errors='replace') if decode else stdout
+                stderr = b"".join(stderr_tail).decode('utf-8', errors='replace')
             
             return {
                 "returncode": process.returncode,
-                "stdout": stdout.decode('utf-8', errors='replace'),
-                "stderr": stderr.decode('utf-8', errors='replace'),
+                "stdout": stdout,
+                "stderr": stderr,
             }
         except asyncio.TimeoutError:
             print(f"Command timed out after {timeout} seconds")
+            await self._abort_command(process, drain_future, container_name)
             return {
                 "returncode": -1,
                 "stdout": "",
                 "stderr": f"Command timed out after {timeout} seconds",
             }
+        except asyncio.CancelledError:
+            # Cancelled from outside (e.g. a per-task timeout): still stop the docker
+            # client and its container; shielded so a second cancel can't skip it
+            await asyncio.shield(self._abort_command(process, drain_future, container_name))
+            raise
         except Exception as e:
+            # Don't leave the process (and any container it started) running unread
+            await self._abort_command(process, drain_future, container_name)
             return {
                 "returncode": -1,
                 "stdout": "",
                 "stderr": str(e),
             }
-
+    
+    async def _abort_command(
+        self,
+        process: Optional[asyncio.subprocess.Process],
+        drain_future: Optional[asyncio.Future],
+        container_name: Optional[str],
+    ) -> None:
+        """Kill a command that was cut short and remove the container it started."""
+        if process is not None and process.returncode is None:
+            process.kill()
+            await process.wait()
+        if drain_future is not None:
+            drain_future.cancel()
+            # Retrieve the outcome so asyncio doesn't log an unretrieved exception
+            await asyncio.gather(drain_future, return_exceptions=True)
+        if container_name:
+            await self._run_command(["docker", "rm", "-f", container_name], timeout=30)
@@ -1,6 +1,7 @@
 """White agent implementation - the target agent being tested."""
 
 import os
+import re
 import json
 import subprocess
 import asyncio
@@ -18,6 +19,9 @@ from litellm import completion
 
 load_dotenv()
 
+# Wait hint in provider rate-limit errors, matched against the lowercased message
+RETRY_AFTER_RE = re.compile(r'try again in (\d+\.?\d*)')
+
 
 # Tool definitions for function calling
 TOOLS = [
@@ -495,15 +499,21 @@ class GeneralWhiteAgentExecutor(AgentExecutor):
                     "TIME HANDLING (IMPORTANT!):\n"
                     "When comparing times in CSV data, ALWAYS convert to minutes or datetime objects. "
                     "DO NOT compare time strings directly like '17:30' >= '17:28' - this gives wrong results!\n"
-                    "Correct approach:\n"
-                    "  hour, minute = time_str.strip().split(':')\n"
-                    "  total_minutes = int(hour) * 60 + int(minute)\n"
-                    "Then compare: total_minutes >= 17*60+30 (for 17:30)\n\n"
+                    "Correct approach (vectorized, no per-row apply):\n"
+                    "  t = pd.to_datetime(df['Clock-out'], format='%H:%M')\n"
+                    "  minutes = t.dt.hour * 60 + t.dt.minute\n"
+                    "Then filter with a boolean mask: df.loc[minutes >= 17*60+30, ['Name']]  (for 17:30)\n"
+                    "Use the thresholds your task states. Example, attendance rule only (left between 17:30 and 18:00):\n"
+                    "  df.loc[(minutes >= 17*60+30) & (minutes <= 18*60), ['Name']]\n\n"
                     "CSV HANDLING (IMPORTANT!):\n"
                     "CSV files often have whitespace in column names and values. ALWAYS strip them:\n"
                     "  df = pd.read_csv('file.csv')\n"
                     "  df.columns = df.columns.str.strip()  # Remove whitespace from column names\n"
-                    "  df = df.apply(lambda x: x.str.strip() if x.dtype == 'object' else x)  # Strip string values\n\n"
+                    "  for col in df.select_dtypes('object'): df[col] = df[col].str.strip()  # Strip string values\n"
+                    "Example for the attendance CSV only (it has 'Name' and 'Clock-out' columns), reading just what a\n"
+                    "clock-out check needs; skipinitialspace makes the header match usecols:\n"
+                    "  df = pd.read_csv('attendance.csv', skipinitialspace=True, usecols=['Name', 'Clock-out'], dtype=str)\n"
+                    "Keep every column (no usecols) when the task also needs others such as 'Date' or 'Clock-in'.\n\n"
                     "OWNCLOUD FILE ACCESS (CRITICAL - DO BOTH STEPS!):\n"
                     "Step 1: FIRST browse to the folder (required for tracking):\n"
                     "  curl -u theagentcompany:theagentcompany 'http://localhost:8092/index.php/apps/files/?dir=/Documents/Financials'\n"
@@ -518,7 +528,8 @@ class GeneralWhiteAgentExecutor(AgentExecutor):
                     "  cat > read_image.py << 'EOF'\n"
                     "import base64\n"
                     "from openai import OpenAI\n"
-                    "b64 = base64.b64encode(open('receipt.jpg','rb').read()).decode()\n"
+                    "with open('receipt.jpg','rb') as f:\n"
+                    "    b64 = base64.b64encode(f.read()).decode('ascii')\n"
                     "r = OpenAI().chat.completions.create(model='gpt-4o', messages=[{'role':'user','content':[{'type':'text','text':'Extract all text from this receipt'},{'type':'image_url','image_url':{'url':f'data:image/jpeg;base64,{b64}'}}]}])\n"
                     "print(r.choices[0].message.content)\n"
                     "EOF\n"
@@ -707,9 +718,8 @@ class GeneralWhiteAgentExecutor(AgentExecutor):
                 error_str = str(e)
                 # Check if it's a rate limit error and retry after delay
                 if "RateLimitError" in error_str or "rate limit" in error_str.lower():
-                    import re
                     # Try to extract wait time from error message
-                    wait_match = re.search(r'try again in (\d+\.?\d*)', error_str.lower())
+                    wait_match = RETRY_AFTER_RE.search(error_str.lower())
                     wait_time = float(wait_match.group(1)) if wait_match else 10
                     wait_time = min(wait_time + 2, 30)  # Add buffer, max 30s
                     execution_log.append(f"⏳ Rate limited, waiting {wait_time}s...")
@@ -772,5 +782,6 @@ def start_white_agent(agent_name="general_white_agent", host=None, port=None):
     ).build()
     
     print(f"Starting white agent at: http://{host}:{port}")
-    uvicorn.run(app, host=host, port=port)
+    # uvicorn's "auto" loop/http use uvloop/httptools when available
+    uvicorn.run(app, host=host, port=port, access_log=False)
 